@@ -53,6 +53,12 @@ INPUT_BUCKET_NAME = os.getenv("INPUT_BUCKET_NAME")
 CONFIG_BUCKET_NAME = os.getenv("CONFIG_BUCKET_NAME")
 CONFIG_PARAM = os.getenv("CONFIG_PARAM")
 
+template_env = jinja2.Environment(  # nosemgrep: direct-use-of-jinja2
+    loader=jinja2.FileSystemLoader(str(importlib.resources.files(smart_prescription_reader) / "prompts")),
+    autoescape=True,
+    auto_reload=False,
+)
+
 
 @event_parser(model=CorrectResponseInput)
 def handler(event: CorrectResponseInput, context: LambdaContext) -> dict:
@@ -65,10 +71,6 @@ def handler(event: CorrectResponseInput, context: LambdaContext) -> dict:
     logger.debug(config.model_dump_json(by_alias=True))
     medications = get_medications(s3, CONFIG_BUCKET_NAME, config.medications_key) if config.medications_key else None
     glossary = get_glossary(s3, CONFIG_BUCKET_NAME, config.glossary_key) if config.glossary_key else None
-    template_env = jinja2.Environment(  # nosemgrep: direct-use-of-jinja2
-        loader=jinja2.FileSystemLoader(str(importlib.resources.files(smart_prescription_reader) / "prompts")),
-        autoescape=True,
-    )
     corrector = CorrectResponse(
         bedrock_client=bedrock,
         template_env=template_env,
@@ -146,8 +146,4 @@ def get_paragraphs(response: "DetectDocumentTextResponseTypeDef") -> str:
     ) = get_the_text_with_required_info([response])
     text_with_line_spacing_info = get_text_with_line_spacing_info(total_text_with_info)
     paragraphs = extract_paragraphs_only(text_with_line_spacing_info)
-    document = ""
-    for p in paragraphs:
-        document += p + "\n"
-
-    return document
+    return "".join(p + "\n" for p in paragraphs)
@@ -5,12 +5,16 @@
 # for the specific language governing permissions and limitations under
 # the License.
 
-import os
+import json
+from functools import cache
+from pathlib import Path
 
 import pytest
 
+_IMAGE_PATH = Path(__file__).with_name("prescription.jpeg")
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def schema() -> dict:
     return {
         "type": "object",
@@ -43,6 +47,19 @@ def schema() -> dict:
     }
 
 
+@pytest.fixture(scope="session")
+def schema_json(schema) -> str:
+    return json.dumps(schema)
+
+
+@pytest.fixture(scope="session")
+def schema_validator(schema):
+    from jsonschema import Draft202012Validator
+
+    Draft202012Validator.check_schema(schema)
+    return Draft202012Validator(schema)
+
+
 @pytest.fixture(scope="class")
 def image_key() -> str:
     key = "test/prescription.jpeg"
@@ -50,16 +67,21 @@ def image_key() -> str:
     return key
 
 
+@cache
+def _image_bytes() -> bytes:
+    return _IMAGE_PATH.read_bytes()
+
+
 def image_bytes_and_content_type(*args, **kwargs) -> tuple[bytes, str]:
-    return open(os.path.join(os.path.dirname(__file__), "prescription.jpeg"), "rb").read(), "image/jpeg"
+    return _image_bytes(), "image/jpeg"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_get_image_bytes_and_content_type(*args, **kwargs):
     return image_bytes_and_content_type
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def extraction():
     return {
         "prescriber": "Dr. Steve Johnson",
@@ -90,7 +112,7 @@ def extraction():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def feedback():
     return """Field-by-field analysis:
 Prescriber:
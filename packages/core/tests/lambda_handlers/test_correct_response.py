@@ -7,7 +7,6 @@
 
 import json
 
-import jsonschema
 import pytest
 
 from smart_prescription_reader.models.workflow import CorrectResponseResult
@@ -20,20 +19,23 @@ class TestCorrectResponseIntegration:
             self,
             monkeypatch,
             mock_get_image_bytes_and_content_type,
-            schema,
+            schema_json,
+            schema_validator,
             image_key,
             extraction,
             feedback,
     ):
+        from smart_prescription_reader.lambda_handlers import correct_response
+
         monkeypatch.setattr(
-            "smart_prescription_reader.lambda_handlers.correct_response.get_image_bytes_and_content_type",
+            correct_response,
+            "get_image_bytes_and_content_type",
             mock_get_image_bytes_and_content_type,
         )
-        from smart_prescription_reader.lambda_handlers import correct_response
 
         response = correct_response.handler(
             {
-                "prescriptionSchema": json.dumps(schema),
+                "prescriptionSchema": schema_json,
                 "image": image_key,
                 "extraction": extraction,
                 "feedback": feedback,
@@ -48,7 +50,7 @@ class TestCorrectResponseIntegration:
         assert serialized_response is not None
 
         try:
-            jsonschema.validate(response["extraction"], schema)
+            schema_validator.validate(response["extraction"])
         except Exception as e:
             assert False, f"Schema validation failed: {e}"
         assert response["usage"]["inputTokens"] > 0
@@ -19,19 +19,21 @@ class TestEvaluateResponseIntegration:
             self,
             monkeypatch,
             mock_get_image_bytes_and_content_type,
-            schema,
+            schema_json,
             image_key,
             extraction,
     ):
+        from smart_prescription_reader.lambda_handlers import evaluate_response
+
         monkeypatch.setattr(
-            "smart_prescription_reader.lambda_handlers.evaluate_response.get_image_bytes_and_content_type",
+            evaluate_response,
+            "get_image_bytes_and_content_type",
             mock_get_image_bytes_and_content_type,
         )
-        from smart_prescription_reader.lambda_handlers import evaluate_response
 
         response = evaluate_response.handler(
             {
-                "prescriptionSchema": json.dumps(schema),
+                "prescriptionSchema": schema_json,
                 "image": image_key,
                 "extraction": extraction,
             },
@@ -7,7 +7,6 @@
 
 import json
 
-import jsonschema
 import pytest
 
 from smart_prescription_reader.models.workflow import ExtractPrescriptionResult
@@ -16,15 +15,24 @@ from smart_prescription_reader.models.workflow import ExtractPrescriptionResult
 @pytest.mark.usefixtures("integration_env")
 @pytest.mark.integration
 class TestExtractPrescriptionIntegration:
-    def test_extract_prescription(self, monkeypatch, mock_get_image_bytes_and_content_type, schema, image_key):
+    def test_extract_prescription(
+        self,
+        monkeypatch,
+        mock_get_image_bytes_and_content_type,
+        schema_json,
+        schema_validator,
+        image_key,
+    ):
+        from smart_prescription_reader.lambda_handlers import extract_prescription
+
         monkeypatch.setattr(
-            "smart_prescription_reader.lambda_handlers.extract_prescription.get_image_bytes_and_content_type",
+            extract_prescription,
+            "get_image_bytes_and_content_type",
             mock_get_image_bytes_and_content_type,
         )
-        from smart_prescription_reader.lambda_handlers import extract_prescription
 
         response = extract_prescription.handler(
-            {"prescriptionSchema": json.dumps(schema), "image": image_key},
+            {"prescriptionSchema": schema_json, "image": image_key},
             {},
         )
 
@@ -36,7 +44,7 @@ class TestExtractPrescriptionIntegration:
 
         assert response["isPrescription"]
         try:
-            jsonschema.validate(response["extraction"], schema)
+            schema_validator.validate(response["extraction"])
         except Exception as e:
             assert False, f"Schema validation failed: {e}"
         assert response["usage"]["inputTokens"] > 0
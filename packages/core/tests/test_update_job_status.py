@@ -7,115 +7,107 @@
 
 import json
 
+import pytest
+
+from smart_prescription_reader.models import ErrorDetail, JobStateEnum, JobStatusEnum, ModelUsage
 from smart_prescription_reader.models.workflow import UpdateJobStatusInput, UpdatePrescriptionJobInput
 from smart_prescription_reader.update_job_status import prepare_update_job
 
 
 class TestUpdateJobStatus:
-    def test_prepare_update_job_with_none_prescription_data(self):
-        """
-        Test prepare_update_job when prescription_data is None.
-        This tests the explicit handling of None prescription_data in the focal method.
-        """
-        input_event = UpdateJobStatusInput(
-            jobId="test_job_id",
-            status="COMPLETED",
-            state="CORRECT",
-            message="Job completed successfully",
-            usage=[{"task": "CORRECT", "inputTokens": 550, "outputTokens": 20}],
-            prescriptionData=None,
-            error=None,
-        )
-
-        result = prepare_update_job(input_event)
-
-        assert isinstance(result, UpdatePrescriptionJobInput)
-        assert result.job_id == "test_job_id"
-        assert result.status.value == "COMPLETED"
-        assert result.state.value == "CORRECT"
-        assert result.message == "Job completed successfully"
-        assert result.usage[0].task == "CORRECT"
-        assert result.usage[0].input_tokens == 550
-        assert result.usage[0].output_tokens == 20
-        assert result.prescription_data is None
-        assert result.error is None
-
-    def test_prepare_update_job_with_prescription_data(self):
-        """
-        Test prepare_update_job function when prescription_data is provided.
-        Verifies that the function correctly transforms UpdateJobStatusInput
-        into UpdatePrescriptionJobInput, including JSON encoding of prescription_data.
-        """
-        input_event = UpdateJobStatusInput(
-            jobId="test_job_id",
-            status="COMPLETED",
-            state="CORRECT",
-            message="Job completed successfully",
-            usage=[{"task": "CORRECT", "inputTokens": 550, "outputTokens": 20}],
-            prescriptionData={"key": "value"},
-            error=None,
-        )
-
-        result = prepare_update_job(input_event)
-
-        assert isinstance(result, UpdatePrescriptionJobInput)
-        assert result.job_id == "test_job_id"
-        assert result.status.value == "COMPLETED"
-        assert result.state.value == "CORRECT"
-        assert result.message == "Job completed successfully"
-        assert result.usage[0].task == "CORRECT"
-        assert result.usage[0].input_tokens == 550
-        assert result.usage[0].output_tokens == 20
-        assert result.prescription_data == json.dumps({"key": "value"})
-        assert result.error is None
-
-    def test_prepare_update_job_with_error(self):
-        """
-        Test prepare_update_job function when error is provided.
-        Verifies that the function correctly transforms UpdateJobStatusInput
-        into UpdatePrescriptionJobInput, including JSON encoding of error.
-        """
-        input_event = UpdateJobStatusInput(
-            jobId="test_job_id",
-            status="FAILED",
-            state="EXTRACT",
-            message="Job failed due to incorrect input",
-            usage=[{"task": "EXTRACT", "inputTokens": 550, "outputTokens": 20}],
-            prescriptionData=None,
-            error={"code": "INVALID_INPUT", "message": "Invalid input provided"},
-        )
-
-        result = prepare_update_job(input_event)
-
-        assert isinstance(result, UpdatePrescriptionJobInput)
-        assert result.job_id == "test_job_id"
-        assert result.status.value == "FAILED"
-        assert result.state.value == "EXTRACT"
-        assert result.message == "Job failed due to incorrect input"
-        assert result.usage[0].task == "EXTRACT"
-        assert result.usage[0].input_tokens == 550
-        assert result.usage[0].output_tokens == 20
-        assert result.prescription_data is None
-        assert result.error.code == "INVALID_INPUT"
-        assert result.error.message == "Invalid input provided"
-
-    def test_prepare_update_job_with_missing_optional_fields(self):
+    @pytest.mark.parametrize(
+        "fields, expected",
+        [
+            pytest.param(
+                {
+                    "status": "COMPLETED",
+                    "state": "CORRECT",
+                    "message": "Job completed successfully",
+                    "usage": [{"task": "CORRECT", "inputTokens": 550, "outputTokens": 20}],
+                    "prescriptionData": None,
+                    "error": None,
+                },
+                {
+                    "status": JobStatusEnum.COMPLETED,
+                    "state": JobStateEnum.CORRECT,
+                    "message": "Job completed successfully",
+                    "usage": [ModelUsage(task="CORRECT", inputTokens=550, outputTokens=20)],
+                    "prescription_data": None,
+                    "error": None,
+                },
+                id="none_prescription_data",
+            ),
+            pytest.param(
+                {
+                    "status": "COMPLETED",
+                    "state": "CORRECT",
+                    "message": "Job completed successfully",
+                    "usage": [{"task": "CORRECT", "inputTokens": 550, "outputTokens": 20}],
+                    "prescriptionData": {"key": "value"},
+                    "error": None,
+                },
+                {
+                    "status": JobStatusEnum.COMPLETED,
+                    "state": JobStateEnum.CORRECT,
+                    "message": "Job completed successfully",
+                    "usage": [ModelUsage(task="CORRECT", inputTokens=550, outputTokens=20)],
+                    "prescription_data": json.dumps({"key": "value"}),
+                    "error": None,
+                },
+                id="with_prescription_data",
+            ),
+            pytest.param(
+                {
+                    "status": "FAILED",
+                    "state": "EXTRACT",
+                    "message": "Job failed due to incorrect input",
+                    "usage": [{"task": "EXTRACT", "inputTokens": 550, "outputTokens": 20}],
+                    "prescriptionData": None,
+                    "error": {"code": "INVALID_INPUT", "message": "Invalid input provided"},
+                },
+                {
+                    "status": JobStatusEnum.FAILED,
+                    "state": JobStateEnum.EXTRACT,
+                    "message": "Job failed due to incorrect input",
+                    "usage": [ModelUsage(task="EXTRACT", inputTokens=550, outputTokens=20)],
+                    "prescription_data": None,
+                    "error": ErrorDetail(code="INVALID_INPUT", message="Invalid input provided"),
+                },
+                id="with_error",
+            ),
+            pytest.param(
+                {
+                    "status": "COMPLETED",
+                    "message": "Job completed successfully",
+                    "usage": [{"task": "CORRECT", "inputTokens": 550, "outputTokens": 20}],
+                },
+                {
+                    "status": JobStatusEnum.COMPLETED,
+                    "state": None,
+                    "message": "Job completed successfully",
+                    "usage": [ModelUsage(task="CORRECT", inputTokens=550, outputTokens=20)],
+                    "prescription_data": None,
+                    "error": None,
+                },
+                id="missing_optional_fields",
+            ),
+        ],
+    )
+    def test_prepare_update_job(self, fields, expected):
         """
-        Test prepare_update_job function when optional fields are missing.
-        Verifies that the function correctly handles the absence of optional fields.
+        Test prepare_update_job transforms UpdateJobStatusInput into UpdatePrescriptionJobInput.
+        Verifies that prescription_data is JSON encoded, that error details are carried over,
+        and that absent optional fields stay unset.
         """
-        input_event = UpdateJobStatusInput(
-            jobId="test_job_id",
-            status="COMPLETED",
-            message="Job completed successfully",
-            usage=[{"task": "CORRECT", "inputTokens": 550, "outputTokens": 20}],
-        )
+        input_event = UpdateJobStatusInput(jobId="test_job_id", **fields)
 
         result = prepare_update_job(input_event)
 
         assert isinstance(result, UpdatePrescriptionJobInput)
         assert result.job_id == "test_job_id"
-        assert result.status.value == "COMPLETED"
-        assert result.message == "Job completed successfully"
-        assert result.prescription_data is None
-        assert result.error is None
+        assert result.status == expected["status"]
+        assert result.state == expected["state"]
+        assert result.message == expected["message"]
+        assert result.usage == expected["usage"]
+        assert result.prescription_data == expected["prescription_data"]
+        assert result.error == expected["error"]
@@ -5,15 +5,16 @@
 # for the specific language governing permissions and limitations under
 # the License.
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
+from smart_prescription_reader import upload_file as upload_file_module
 from smart_prescription_reader.upload_file import upload_file
 
 
-@patch("smart_prescription_reader.upload_file.create_presigned_url")
-def test_upload_file(mock_create_presigned_url, monkeypatch):
+def test_upload_file(monkeypatch):
     url = "https://test-bucket.s3.amazonaws.com/test-file.png?TESTSTRING"
-    mock_create_presigned_url.return_value = url
+    mock_create_presigned_url = MagicMock(return_value=url)
+    monkeypatch.setattr(upload_file_module, "create_presigned_url", mock_create_presigned_url)
 
     s3_client = MagicMock()
     response = upload_file(